@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
 from pathlib import Path
 
 import numpy as np
@@ -11,17 +12,22 @@ from flux.decorators import workflow
 from flux.tasks import parallel
 from flux.tasks import pipeline
 
+# the pyarrow engine parses CSV files using multiple threads
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") else "c"
+
 
 @task
 def load_data(file_name: str) -> pd.DataFrame:
     if not Path(file_name).exists():
         raise FileNotFoundError(f"File not found: {file_name}")
-    return pd.read_csv(file_name)
+    return pd.read_csv(file_name, engine=CSV_ENGINE)
 
 
 @task
 def split_data(df: pd.DataFrame) -> list[pd.DataFrame]:
-    return np.array_split(df, 10)
+    # slice by row ranges so each shard is a view instead of a copy
+    bounds = np.linspace(0, len(df), 11, dtype=int)
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
 
 
 @task
@@ -31,7 +37,7 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
 
 @task
 def process_data(dfs: list[pd.DataFrame]):
-    tasks = [lambda: clean_data(df) for df in dfs]
+    tasks = [lambda df=df: clean_data(df) for df in dfs]
     results = yield parallel(*tasks)
     return results
 
@@ -43,31 +49,42 @@ def join_data(dfs: list[pd.DataFrame]) -> pd.DataFrame:
 
 @task
 def save_data(df: pd.DataFrame, file_name: str):
-    Path(file_name).parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(file_name)
+    path = Path(file_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        df.to_parquet(path, compression="zstd")
+    else:
+        df.to_csv(path)
     return df
 
 
 @task
-def analyze_data(df: pd.DataFrame):
+def analyze_data(df: pd.DataFrame, deep_memory: bool = False):
+    # describe all columns in a single pass and slice the result per dtype
+    stats = df.describe(include="all")
+    categorical_rows = ["count", "unique", "top", "freq"]
+    numeric_rows = ~stats.index.isin(["unique", "top", "freq"])
+    numeric_columns = df.select_dtypes(include=[np.number]).columns
+    categorical_columns = df.select_dtypes(include=["object", "category"]).columns
+    null_counts = df.isnull().sum()
+
     summary = {
         "shape": df.shape,
         "columns": df.columns.tolist(),
         "size": df.size,
         "total_elements": df.size,
-        "memory_usage": df.memory_usage(deep=True).sum(),
+        "memory_usage": df.memory_usage(deep=deep_memory).sum(),
         "dtypes": df.dtypes.apply(str).to_dict(),
-        "null_counts": df.isnull().sum().to_dict(),
-        "null_percentages": (df.isnull().mean() * 100).round(2).to_dict(),
-        "numeric_stats": df.describe(include=[np.number]).to_dict(),
+        "null_counts": null_counts.to_dict(),
+        "null_percentages": (null_counts / len(df) * 100).round(2).to_dict(),
+        "numeric_stats": stats.loc[numeric_rows, numeric_columns].to_dict(),
         "sample_values": df.head(1).to_dict(orient="records")[0],
         "unique_counts": df.nunique().to_dict(),
     }
 
     # Add categorical statistics if any exist
-    categorical_stats = df.describe(include=["object", "category"])
-    if not categorical_stats.empty:
-        summary["categorical_stats"] = categorical_stats.to_dict()
+    if len(categorical_columns) > 0:
+        summary["categorical_stats"] = stats.loc[categorical_rows, categorical_columns].to_dict()
 
     return summary
 
@@ -80,16 +97,18 @@ def complex_pipeline(ctx: WorkflowExecutionContext[dict[str, str]]):
         process_data,
         join_data,
         lambda df: save_data(df, ctx.input["output_file"]),
-        analyze_data,
+        lambda df: analyze_data(df, ctx.input.get("deep_memory", False)),
         input=ctx.input["input_file"],
     )
     return df
 
 
 if __name__ == "__main__":  # pragma: no cover
+    # writing parquet needs pyarrow, which is optional
+    output_format = "parquet" if find_spec("pyarrow") else "csv"
     input = {
         "input_file": "examples/data/sample.csv",
-        "output_file": ".data/sample_output.csv",
+        "output_file": f".data/sample_output.{output_format}",
     }
 
     ctx = complex_pipeline.run(input)
@@ -6,9 +6,10 @@ from flux import WorkflowExecutionContext
 
 
 def fibo(n: int):
-    if n <= 1:
-        return n
-    return fibo(n - 1) + fibo(n - 2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 
 @task.with_options(name="sum_fibo_{iteration}")
@@ -17,6 +18,11 @@ def sum_fibo(iteration: int, n: int):
     return fibo(n)
 
 
+@task
+def sum_fibo_batch(iterations: int, n: int):
+    return {f"Iteration #{i}": fibo(n) for i in range(iterations)}
+
+
 @workflow
 def fibo_benchmark(ctx: WorkflowExecutionContext[tuple[int, int]]):
     iterations = ctx.input[0]
@@ -28,6 +34,16 @@ def fibo_benchmark(ctx: WorkflowExecutionContext[tuple[int, int]]):
     return results
 
 
+@workflow
+def fibo_benchmark_batch(ctx: WorkflowExecutionContext[tuple[int, int]]):
+    iterations = ctx.input[0]
+    n = ctx.input[1]
+    return (yield sum_fibo_batch(iterations, n))
+
+
 if __name__ == "__main__":  # pragma: no cover
     ctx = fibo_benchmark.run((10, 33))
     print(ctx.to_json())
+
+    ctx = fibo_benchmark_batch.run((10, 33))
+    print(ctx.to_json())
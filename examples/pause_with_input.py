@@ -16,5 +16,5 @@ if __name__ == "__main__":  # pragma: no cover
     ctx = pause_with_input_workflow.run()
     print(ctx.to_json())
 
-    pause_with_input_workflow.run(input="Joe", execution_id=ctx.execution_id)
+    ctx = pause_with_input_workflow.run(input="Joe", execution_id=ctx.execution_id)
     print(ctx.to_json())
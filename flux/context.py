@@ -6,6 +6,7 @@ from typing import Generic
 from typing import TypeVar
 from uuid import uuid4
 
+from flux.encoders import to_primitive
 from flux.events import ExecutionEvent
 from flux.events import ExecutionEventType
 from flux.utils import FluxEncoder
@@ -83,10 +84,16 @@ class WorkflowExecutionContext(Generic[WorkflowInputType]):
         return None
 
     def summary(self):
-        return {key: value for key, value in self.to_dict().items() if key != "events"}
+        summary = {
+            "name": self.name,
+            "execution_id": self.execution_id,
+            "input": self.input,
+            "output": self.output,
+        }
+        return to_primitive(summary)
 
     def to_dict(self):
-        return json.loads(self.to_json())
+        return to_primitive(self)
 
     def to_json(self):
         return json.dumps(self, indent=4, cls=FluxEncoder)
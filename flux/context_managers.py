@@ -3,7 +3,9 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 from flux.context import WorkflowExecutionContext
 from flux.errors import ExecutionContextNotFoundError
@@ -33,17 +35,14 @@ class SQLiteContextManager(ContextManager, SQLiteRepository):
     def save(self, ctx: WorkflowExecutionContext):
         with self.session() as session:
             try:
-                context = session.get(
-                    WorkflowExecutionContextModel,
-                    ctx.execution_id,
-                )
-                if context:
-                    context.output = ctx.output
-                    additional_events = self._get_additional_events(
-                        ctx,
-                        context,
-                    )
-                    context.events.extend(additional_events)
+                # update in place instead of loading (and unpickling) the stored context first
+                updated = session.execute(
+                    update(WorkflowExecutionContextModel)
+                    .where(WorkflowExecutionContextModel.execution_id == ctx.execution_id)
+                    .values(output=ctx.output),
+                ).rowcount
+                if updated:
+                    session.add_all(self._get_additional_events(session, ctx))
                 else:
                     session.add(WorkflowExecutionContextModel.from_plain(ctx))
                 session.commit()
@@ -61,8 +60,14 @@ class SQLiteContextManager(ContextManager, SQLiteRepository):
                 return context.to_plain()
             raise ExecutionContextNotFoundError(execution_id)
 
-    def _get_additional_events(self, ctx, context):
-        existing_events = [(e.event_id, e.type) for e in context.events]
+    def _get_additional_events(self, session: Session, ctx: WorkflowExecutionContext):
+        existing_events = {
+            (event_id, type)
+            for event_id, type in session.query(
+                ExecutionEventModel.event_id,
+                ExecutionEventModel.type,
+            ).filter(ExecutionEventModel.execution_id == ctx.execution_id)
+        }
         return [
             ExecutionEventModel.from_plain(ctx.execution_id, e)
             for e in ctx.events
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
-import os
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
@@ -23,6 +23,7 @@ from flux.output_storage import OutputStorage
 from flux.secret_managers import SecretManager
 from flux.utils import call_with_timeout
 from flux.utils import make_hashable
+from flux.utils import max_workers
 
 T = TypeVar("T", bound=Any)
 F = TypeVar("F", bound=Callable[..., Any])
@@ -130,13 +131,13 @@ class workflow:
         self,
         input: Any | None = None,
         execution_id: str | None = None,
-        options: dict[str, Any] = {},
+        options: dict[str, Any] | None = None,
     ) -> WorkflowExecutionContext:
-        options.update({"module": self._func.__module__})
+        options = {**(options or {}), "module": self._func.__module__}
         return WorkflowExecutor.get(options).execute(self._func.__name__, input, execution_id)
 
     def map(self, inputs: list[Any] = []) -> list[WorkflowExecutionContext]:
-        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        with ThreadPoolExecutor(max_workers=max_workers()) as executor:
             return list(executor.map(lambda i: self.run(i), inputs))
 
 
@@ -196,6 +197,7 @@ class task:
         self.secret_requests = secret_requests
         self.output_storage = output_storage
         self.cache = cache
+        self._arg_names = getfullargspec(func).args
         wraps(func)(self)
 
     def __get__(self, instance, owner):
@@ -205,7 +207,7 @@ class task:
         )
 
     def __call__(self, *args, **kwargs) -> Any:
-        args_with_self = self.__get_task_args(self._func, args)
+        args_with_self = self.__get_task_args(args)
         self.full_name = self.__get_task_name(self._func, self.name, args_with_self)
 
         task_args = {k: v for k, v in args_with_self.items() if k != "self"}
@@ -237,7 +239,7 @@ class task:
         return output
 
     def map(self, args: list[Any] = []):
-        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        with ThreadPoolExecutor(max_workers=max_workers()) as executor:
             return list(
                 executor.map(
                     lambda arg: (
@@ -255,8 +257,7 @@ class task:
     def __get_task_name(self, func: Callable, name: str | None, args: dict) -> str:
         return name.format(**args) if name else f"{func.__name__}"
 
-    def __get_task_args(self, func: Callable, args: tuple) -> dict:
-        arg_names = getfullargspec(func).args
+    def __get_task_args(self, args: tuple) -> dict:
         arg_values: list[Any] = []
 
         for arg in args:
@@ -271,11 +272,56 @@ class task:
             else:
                 arg_values.append(arg)
 
-        return dict(zip(arg_names, arg_values))
+        return dict(zip(self._arg_names, arg_values))
 
     def __get_task_id(self, task_name: str, args: dict, kwargs: dict):
         return f"{task_name}_{abs(hash((task_name, make_hashable(args), make_hashable(kwargs))))}"
 
+    def __get_cache_key(self, task_name: str, args: tuple, kwargs: dict) -> str | None:
+        try:
+            arguments = inspect.signature(self._func).bind(*args, **kwargs)
+        except TypeError:
+            # invalid arguments, leave it to the call itself to raise
+            return None
+        # bind defaults so changing them does not serve results computed with the old ones
+        arguments.apply_defaults()
+
+        # unlike hash(), the digest is stable across processes so cached outputs can be reused;
+        # the function identity and code keep same-named or edited tasks from sharing entries.
+        # Module globals read by the task are not tracked, clear the cache when they change.
+        key = repr(
+            self.__get_stable_value(
+                (
+                    self._func.__module__,
+                    self._func.__qualname__,
+                    self.__get_code_fingerprint(getattr(self._func, "__code__", None)),
+                    task_name,
+                    make_hashable(dict(arguments.arguments)),
+                ),
+            ),
+        )
+        return f"{task_name}_{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def __get_code_fingerprint(self, code: Any) -> Any:
+        if not inspect.iscode(code):
+            return None
+        # nested code objects repr with their memory address, so fingerprint them instead
+        return (
+            code.co_code.hex(),
+            tuple(
+                self.__get_code_fingerprint(c) if inspect.iscode(c) else c for c in code.co_consts
+            ),
+            code.co_names,
+        )
+
+    def __get_stable_value(self, value: Any) -> Any:
+        # frozensets iterate in hash-seed dependent order, so their repr is not stable
+        if isinstance(value, tuple):
+            return tuple(self.__get_stable_value(v) for v in value)
+        if isinstance(value, frozenset):
+            return ("frozenset", sorted(repr(self.__get_stable_value(v)) for v in value))
+        return value
+
     def __execute(
         self,
         task_id: str,
@@ -290,9 +336,10 @@ class task:
 
         yield
 
-        if self.cache:
-            output = CacheManager.get(self.task_id)
-            if output:
+        cache_key = self.__get_cache_key(task_name, args, kwargs) if self.cache else None
+        if cache_key:
+            output = CacheManager.get(cache_key)
+            if output is not None:
                 return output
 
         if self.secret_requests:
@@ -307,8 +354,8 @@ class task:
             self.timeout,
         )
 
-        if self.cache:
-            CacheManager.set(self.task_id, output)
+        if cache_key:
+            CacheManager.set(cache_key, output)
 
         return output
 
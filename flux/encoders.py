@@ -1 +1,39 @@
 from __future__ import annotations
+
+import json
+from typing import Any
+
+from flux.utils import FluxEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_encoder = FluxEncoder()
+
+
+def _default(obj: Any) -> Any:
+    # orjson only encodes exact floats natively, subclasses such as numpy.float64 end up here
+    if isinstance(obj, float):
+        return float(obj)
+    return _encoder.default(obj)
+
+
+def to_primitive(obj: Any) -> Any:
+    """
+    Convert an object into plain JSON values (dicts, lists, strings, numbers, booleans and None).
+
+    Uses `orjson` when it is installed and falls back to the standard `json` module otherwise,
+    or when `orjson` cannot encode the object (e.g. integers larger than 64 bits).
+    Non-finite floats (NaN, infinities) become None either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(
+                orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS),
+            )
+        except orjson.JSONEncodeError:
+            pass
+    # orjson encodes NaN and infinities as null, mirror that so both paths agree
+    return json.loads(json.dumps(obj, cls=FluxEncoder), parse_constant=lambda _: None)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 from datetime import datetime
+from threading import Lock
 from typing import Any
 
 import dill
@@ -12,6 +13,8 @@ from Crypto.Random import get_random_bytes
 from sqlalchemy import Column
 from sqlalchemy import create_engine
 from sqlalchemy import DateTime
+from sqlalchemy import Engine
+from sqlalchemy import event
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
@@ -34,9 +37,39 @@ class Base(DeclarativeBase):
 
 
 class SQLiteRepository:
+    _engines: dict[str, Engine] = {}
+    _lock: Lock = Lock()
+
     def __init__(self):
-        self._engine = create_engine(Configuration.get().settings.database_url)
-        Base.metadata.create_all(self._engine)
+        self._engine = self._get_engine(Configuration.get().settings.database_url)
+
+    @classmethod
+    def _get_engine(cls, database_url: str) -> Engine:
+        """Share one engine (and connection pool) per database URL"""
+        if database_url not in cls._engines:
+            with cls._lock:
+                if database_url not in cls._engines:
+                    engine = create_engine(database_url)
+                    if engine.dialect.name == "sqlite":
+                        event.listen(engine, "connect", cls._set_sqlite_pragmas)
+                    Base.metadata.create_all(engine)
+                    # create_all skips existing tables,
+                    # so add indexes introduced after those tables were made
+                    for table in Base.metadata.sorted_tables:
+                        for index in table.indexes:
+                            index.create(engine, checkfirst=True)
+                    cls._engines[database_url] = engine
+        return cls._engines[database_url]
+
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Use write-ahead logging so commits do not rewrite the journal on every save.
+        synchronous is left at FULL, replay depends on committed events surviving a crash.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
 
     def session(self) -> Session:
         return Session(self._engine)
@@ -193,6 +226,7 @@ class ExecutionEventModel(Base):
         String,
         ForeignKey("workflow_executions.execution_id"),
         nullable=False,
+        index=True,
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
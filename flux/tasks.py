@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import random
 import time
 import uuid
@@ -17,6 +16,7 @@ from typing import Literal
 
 import flux.decorators as decorators
 from flux.executors import WorkflowExecutor
+from flux.utils import max_workers
 
 
 @decorators.task
@@ -47,7 +47,7 @@ def randrange(start: int, stop: int | None = None, step: int = 1):
 @decorators.task
 def parallel(*functions: Callable):
     results = []
-    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    with ThreadPoolExecutor(max_workers=max_workers()) as executor:
         futures = [executor.submit(func) for func in functions]
         for future in as_completed(futures):
             result = yield from future.result()
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
 import json
+import os
+import pickle
+import sys
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
@@ -16,6 +20,7 @@ from typing import Callable
 from typing import Literal
 
 import flux.context as context
+from flux.config import Configuration
 from flux.errors import ExecutionError
 from flux.errors import ExecutionTimeoutError
 
@@ -28,17 +33,23 @@ def call_with_timeout(
     timeout: int,
 ):
     if timeout > 0:
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            try:
-                future = executor.submit(func)
-                return future.result(timeout)
-            except TimeoutError:
-                future.cancel()
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise ExecutionTimeoutError(type, name, id, timeout)
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(func)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise ExecutionTimeoutError(type, name, id, timeout)
+        finally:
+            # never wait on a timed out call, otherwise the timeout is only raised after it returns
+            executor.shutdown(wait=False, cancel_futures=True)
     return func()
 
 
+def max_workers() -> int:
+    return Configuration.get().settings.executor.max_workers or os.cpu_count() or 1
+
+
 def make_hashable(item):
     if isinstance(item, dict):
         return tuple(sorted((k, make_hashable(v)) for k, v in item.items()))
@@ -46,14 +57,33 @@ def make_hashable(item):
         return tuple(make_hashable(i) for i in item)
     elif isinstance(item, set):
         return frozenset(make_hashable(i) for i in item)
-    elif type(item).__name__ == "pandas.DataFrame":
-        return tuple(map(tuple, item.itertuples(index=False)))
     elif is_hashable(item):
         return item
+    elif isinstance(item, tuple):
+        return tuple(make_hashable(i) for i in item)
+    elif digest := _get_pandas_digest(item):
+        # str() of a DataFrame/Series is a truncated preview, the digest covers every value
+        return f"{item}\n{digest}"
     else:
         return str(item)
 
 
+def _get_pandas_digest(item) -> str | None:
+    pandas = sys.modules.get("pandas")
+    if pandas is None or not isinstance(item, (pandas.DataFrame, pandas.Series)):
+        return None
+    frame = item.to_frame() if isinstance(item, pandas.Series) else item
+    digest = hashlib.sha256(
+        repr((type(item).__name__, list(frame.columns), list(map(str, frame.dtypes)))).encode(),
+    )
+    try:
+        digest.update(pandas.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    except TypeError:
+        # cells holding unhashable values (e.g. lists) cannot be hashed by pandas
+        digest.update(pickle.dumps(frame))
+    return digest.hexdigest()
+
+
 def is_hashable(obj) -> bool:
     try:
         hash(obj)
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+import importlib
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
 from examples.tasks.task_cache import workflow_with_cached_task
+from flux.cache import CacheManager
 
 
 def test_should_succeed():
@@ -20,3 +29,106 @@ def test_should_fail():
     ctx = workflow_with_cached_task.run()
     assert ctx.finished and ctx.failed, "The workflow should have failed."
     assert isinstance(ctx.output, ValueError)
+
+
+MODULE = """
+from flux import task
+from flux import workflow
+
+
+@task.with_options(cache=True)
+def transform(x, factor={factor}):
+    return {body}
+
+
+@workflow
+def {name}_workflow(ctx):
+    return (yield transform(ctx.input))
+"""
+
+
+def write_module(path, name: str, body: str = "x * factor", factor: int = 2):
+    (path / f"{name}.py").write_text(MODULE.format(name=name, body=body, factor=factor))
+
+
+def cache_keys(mocker, workflow, input):
+    mocker.patch.object(CacheManager, "get", return_value=None)
+    cache_set = mocker.patch.object(CacheManager, "set")
+    ctx = workflow.run(input)
+    assert ctx.finished and ctx.succeeded, "The workflow should have been completed successfully."
+    return [call.args[0] for call in cache_set.call_args_list]
+
+
+def test_cache_key_should_be_stable_across_processes(tmp_path):
+    write_module(tmp_path, "cache_seed", body="sorted(x)")
+    script = (
+        "from unittest import mock;"
+        "from flux.cache import CacheManager;"
+        "from cache_seed import cache_seed_workflow;"
+        "mock.patch.object(CacheManager, 'get', return_value=None).start();"
+        "cache_set = mock.patch.object(CacheManager, 'set').start();"
+        "cache_seed_workflow.run({'x', 'y', 'z'});"
+        "print(cache_set.call_args.args[0])"
+    )
+    python_path = os.pathsep.join([str(tmp_path), os.getcwd()])
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": python_path},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(keys) == 1
+
+
+def test_should_not_share_cache_between_same_named_tasks(tmp_path, monkeypatch):
+    write_module(tmp_path, "cache_double", body="x * 2")
+    write_module(tmp_path, "cache_offset", body="x + 100")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(CacheManager, "_get_file_name", lambda key: tmp_path / f"{key}.pkl")
+
+    double = importlib.import_module("cache_double").cache_double_workflow
+    offset = importlib.import_module("cache_offset").cache_offset_workflow
+
+    assert double.run(5).output == 10
+    assert offset.run(5).output == 105
+
+
+def test_should_not_reuse_cache_when_defaults_change(tmp_path, monkeypatch, mocker):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    write_module(tmp_path, "cache_defaults", factor=2)
+    module = importlib.import_module("cache_defaults")
+    first = cache_keys(mocker, module.cache_defaults_workflow, 5)
+
+    write_module(tmp_path, "cache_defaults", factor=3)
+    module = importlib.reload(module)
+    second = cache_keys(mocker, module.cache_defaults_workflow, 5)
+
+    assert first != second
+
+
+def test_should_not_share_cache_between_different_dataframes(tmp_path, monkeypatch, mocker):
+    write_module(tmp_path, "cache_frames", body="x.sum()")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    workflow = importlib.import_module("cache_frames").cache_frames_workflow
+
+    df = pd.DataFrame({"value": range(100)})
+    changed = df.copy()
+    changed.loc[50, "value"] = -1
+
+    assert cache_keys(mocker, workflow, df) != cache_keys(mocker, workflow, changed)
+
+
+@pytest.mark.parametrize("cached", [0, []])
+def test_should_use_falsy_cached_output(mocker, cached):
+    mocker.patch.object(CacheManager, "get", return_value=cached)
+    cache_set = mocker.patch.object(CacheManager, "set")
+    ctx = workflow_with_cached_task.run((2, 3, 2))
+    assert ctx.finished and ctx.succeeded
+    assert ctx.output == [cached, cached]
+    cache_set.assert_not_called()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import pandas as pd
+import pytest
+
 from examples import complex_pipeline
 from flux.config import Configuration
 
@@ -14,10 +17,25 @@ def test_should_succeed():
 
     ctx = complex_pipeline.run(input)
     assert ctx.finished and ctx.succeeded, "The workflow should have been completed successfully."
+    assert ctx.output["unique_counts"]["id"] == 1000, "Every row should be kept after cleaning."
 
     return ctx
 
 
+def test_should_save_parquet():
+    pytest.importorskip("pyarrow")
+    settings = Configuration.get().settings
+
+    input = {
+        "input_file": "examples/data/sample.csv",
+        "output_file": f"{settings.home}/.test/sample_output.parquet",
+    }
+
+    ctx = complex_pipeline.run(input)
+    assert ctx.finished and ctx.succeeded, "The workflow should have been completed successfully."
+    assert len(pd.read_parquet(input["output_file"])) == 1000
+
+
 def test_should_skip_if_finished():
     first_ctx = test_should_succeed()
     second_ctx = complex_pipeline.run(execution_id=first_ctx.execution_id)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+from sqlalchemy import text
 
 from examples.hello_world import hello_world
 from flux.context_managers import ContextManager
 from flux.errors import ExecutionContextNotFoundError
+from flux.models import Base
+from flux.models import ExecutionEventModel
+from flux.models import SQLiteRepository
 
 
 def test_should_get_existing_context():
@@ -24,3 +30,15 @@ def test_should_raise_exception_when_not_found():
         match=f"Execution context '{execution_id}' not found",
     ):
         ContextManager.default().get(execution_id)
+
+
+def test_should_add_missing_indexes_to_existing_database(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'flux.db'}"
+    # a database created before execution_id was indexed
+    with create_engine(database_url).begin() as connection:
+        Base.metadata.create_all(connection)
+        connection.execute(text("DROP INDEX ix_workflow_execution_events_execution_id"))
+
+    engine = SQLiteRepository._get_engine(database_url)
+    indexes = inspect(engine).get_indexes(ExecutionEventModel.__tablename__)
+    assert any(index["column_names"] == ["execution_id"] for index in indexes)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+
+import flux.encoders as encoders
+from flux.encoders import to_primitive
+
+
+class Color(Enum):
+    RED = "red"
+
+
+SAMPLE = {
+    1: "one",
+    "color": Color.RED,
+    "when": datetime(2024, 1, 1, 10, 30),
+    "items": (1, 2.5, None),
+    "error": ValueError("boom"),
+    "nan": float("nan"),
+    "inf": [float("inf"), float("-inf")],
+}
+
+EXPECTED = {
+    "1": "one",
+    "color": "red",
+    "when": "2024-01-01T10:30:00",
+    "items": [1, 2.5, None],
+    "error": {"type": "ValueError", "message": "boom"},
+    "nan": None,
+    "inf": [None, None],
+}
+
+
+def test_to_primitive():
+    assert to_primitive(SAMPLE) == EXPECTED
+
+
+def test_to_primitive_without_orjson(monkeypatch):
+    monkeypatch.setattr(encoders, "orjson", None)
+    assert to_primitive(SAMPLE) == EXPECTED
+
+
+def test_to_primitive_should_fallback_for_large_integers():
+    assert to_primitive({"big": 2**70, "nan": float("nan")}) == {"big": 2**70, "nan": None}
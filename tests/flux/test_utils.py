@@ -9,12 +9,14 @@ from enum import Enum
 
 import pytest
 
+from flux.config import Configuration
 from flux.context import WorkflowExecutionContext
 from flux.errors import ExecutionTimeoutError
 from flux.utils import call_with_timeout
 from flux.utils import FluxEncoder
 from flux.utils import is_hashable
 from flux.utils import make_hashable
+from flux.utils import max_workers
 from flux.utils import to_json
 
 
@@ -43,6 +45,17 @@ def test_call_with_timeout_exceeds_timeout():
         call_with_timeout(slow_func, "Task", "test_task", "123", 1)
 
 
+def test_call_with_timeout_does_not_wait_for_timed_out_call():
+    def slow_func():
+        time.sleep(3)
+        return "success"
+
+    start = time.monotonic()
+    with pytest.raises(ExecutionTimeoutError):
+        call_with_timeout(slow_func, "Task", "test_task", "123", 1)
+    assert time.monotonic() - start < 2
+
+
 def test_make_hashable_basic_types():
     assert make_hashable(1) == 1
     assert make_hashable("test") == "test"
@@ -93,3 +106,11 @@ def test_flux_encoder():
 def test_to_json():
     data = {"test": "value"}
     assert to_json(data) == json.dumps(data, indent=4, cls=FluxEncoder)
+
+
+def test_max_workers_uses_executor_setting():
+    Configuration.get().override(executor={"max_workers": 2})
+    try:
+        assert max_workers() == 2
+    finally:
+        Configuration.get().reset()